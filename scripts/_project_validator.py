@@ -0,0 +1,230 @@
+"""Generated by scripts/build_validators.py from schemas/project.json. Do not edit."""
+
+SCHEMA_SHA256 = "ebb5230630b4436c34ba76b52c286038689c186bb84d512eb5ee62104571bb14"
+VERSION = "2.22.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+REGEX_PATTERNS = {
+    'uri_re_pattern': re.compile('^\\w+:(\\/?\\/?)[^\\s]+\\Z'),
+    'date-time_re_pattern': re.compile('^\\d{4}-[01]\\d-[0-3]\\d(t|T)[0-2]\\d:[0-5]\\d:[0-5]\\d(?:\\.\\d+)?(?:[+-][0-2]\\d:[0-5]\\d|[+-][0-2]\\d[0-5]\\d|z|Z)\\Z')
+}
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2019-09/schema', 'type': 'object', 'properties': {'name': {'type': 'string'}, 'description': {'type': 'string', 'maxLength': 512}, 'country': {'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'category': {'type': 'string', 'enum': ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']}, 'source': {'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, 'owner': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, 'metadata': {'type': 'object', 'properties': {'filename': {'type': 'string'}, 'created_at': {'type': 'string', 'format': 'date-time'}}, 'required': ['created_at', 'filename'], 'additionalProperties': True}}, 'required': ['name', 'description', 'category', 'source', 'owner'], 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'description', 'category', 'source', 'owner']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2019-09/schema', 'type': 'object', 'properties': {'name': {'type': 'string'}, 'description': {'type': 'string', 'maxLength': 512}, 'country': {'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'category': {'type': 'string', 'enum': ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']}, 'source': {'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, 'owner': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, 'metadata': {'type': 'object', 'properties': {'filename': {'type': 'string'}, 'created_at': {'type': 'string', 'format': 'date-time'}}, 'required': ['created_at', 'filename'], 'additionalProperties': True}}, 'required': ['name', 'description', 'category', 'source', 'owner'], 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'maxLength': 512}, rule='type')
+            if isinstance(data__description, str):
+                data__description_len = len(data__description)
+                if data__description_len > 512:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be shorter than or equal to 512 characters", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'maxLength': 512}, rule='maxLength')
+        if "country" in data_keys:
+            data_keys.remove("country")
+            data__country = data["country"]
+            if not isinstance(data__country, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".country must be array", value=data__country, name="" + (name_prefix or "data") + ".country", definition={'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, rule='type')
+            data__country_is_list = isinstance(data__country, (list, tuple))
+            if data__country_is_list:
+                data__country_len = len(data__country)
+                if data__country_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".country must contain at least 1 items", value=data__country, name="" + (name_prefix or "data") + ".country", definition={'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, rule='minItems')
+                if data__country_len > 3:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".country must contain less than or equal to 3 items", value=data__country, name="" + (name_prefix or "data") + ".country", definition={'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, rule='maxItems')
+                def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                if data__country_len > len(set(fn(data__country_x) for data__country_x in data__country)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".country must contain unique items", value=data__country, name="" + (name_prefix or "data") + ".country", definition={'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, rule='uniqueItems')
+                for data__country_x, data__country_item in enumerate(data__country):
+                    if not isinstance(data__country_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".country[{data__country_x}]".format(**locals()) + " must be string", value=data__country_item, name="" + (name_prefix or "data") + ".country[{data__country_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}, rule='type')
+                    if not (isinstance(data__country_item, str) and data__country_item == 'Italy' or isinstance(data__country_item, str) and data__country_item == 'France' or isinstance(data__country_item, str) and data__country_item == 'Germany' or isinstance(data__country_item, str) and data__country_item == 'Spain' or isinstance(data__country_item, str) and data__country_item == 'Poland' or isinstance(data__country_item, str) and data__country_item == 'Netherlands' or isinstance(data__country_item, str) and data__country_item == 'Belgium' or isinstance(data__country_item, str) and data__country_item == 'Sweden' or isinstance(data__country_item, str) and data__country_item == 'Austria' or isinstance(data__country_item, str) and data__country_item == 'Czech Republic' or isinstance(data__country_item, str) and data__country_item == 'Denmark' or isinstance(data__country_item, str) and data__country_item == 'Finland' or isinstance(data__country_item, str) and data__country_item == 'Greece' or isinstance(data__country_item, str) and data__country_item == 'Hungary' or isinstance(data__country_item, str) and data__country_item == 'Ireland' or isinstance(data__country_item, str) and data__country_item == 'Croatia' or isinstance(data__country_item, str) and data__country_item == 'Lithuania' or isinstance(data__country_item, str) and data__country_item == 'Latvia' or isinstance(data__country_item, str) and data__country_item == 'Slovakia' or isinstance(data__country_item, str) and data__country_item == 'Slovenia' or isinstance(data__country_item, str) and data__country_item == 'Estonia' or isinstance(data__country_item, str) and data__country_item == 'Portugal' or isinstance(data__country_item, str) and data__country_item == 'Bulgaria' or isinstance(data__country_item, str) and data__country_item == 'Romania' or isinstance(data__country_item, str) and data__country_item == 'Luxembourg' or isinstance(data__country_item, str) and data__country_item == 'Malta' or isinstance(data__country_item, str) and data__country_item == 'Cyprus' or isinstance(data__country_item, str) and data__country_item == 'United Kingdom'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".country[{data__country_x}]".format(**locals()) + " must be one of ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']", value=data__country_item, name="" + (name_prefix or "data") + ".country[{data__country_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}, rule='enum')
+        if "tags" in data_keys:
+            data_keys.remove("tags")
+            data__tags = data["tags"]
+            if not isinstance(data__tags, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags must be array", value=data__tags, name="" + (name_prefix or "data") + ".tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='type')
+            data__tags_is_list = isinstance(data__tags, (list, tuple))
+            if data__tags_is_list:
+                data__tags_len = len(data__tags)
+                if data__tags_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags must contain at least 1 items", value=data__tags, name="" + (name_prefix or "data") + ".tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='minItems')
+                if data__tags_len > 10:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags must contain less than or equal to 10 items", value=data__tags, name="" + (name_prefix or "data") + ".tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='maxItems')
+                def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                if data__tags_len > len(set(fn(data__tags_x) for data__tags_x in data__tags)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags must contain unique items", value=data__tags, name="" + (name_prefix or "data") + ".tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='uniqueItems')
+                for data__tags_x, data__tags_item in enumerate(data__tags):
+                    if not isinstance(data__tags_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + " must be string", value=data__tags_item, name="" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 24}, rule='type')
+                    if isinstance(data__tags_item, str):
+                        data__tags_item_len = len(data__tags_item)
+                        if data__tags_item_len > 24:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + " must be shorter than or equal to 24 characters", value=data__tags_item, name="" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 24}, rule='maxLength')
+        if "category" in data_keys:
+            data_keys.remove("category")
+            data__category = data["category"]
+            if not isinstance(data__category, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".category must be string", value=data__category, name="" + (name_prefix or "data") + ".category", definition={'type': 'string', 'enum': ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']}, rule='type')
+            if not (isinstance(data__category, str) and data__category == 'app' or isinstance(data__category, str) and data__category == 'saas' or isinstance(data__category, str) and data__category == 'paas' or isinstance(data__category, str) and data__category == 'faas' or isinstance(data__category, str) and data__category == 'package' or isinstance(data__category, str) and data__category == 'library' or isinstance(data__category, str) and data__category == 'learning' or isinstance(data__category, str) and data__category == 'language' or isinstance(data__category, str) and data__category == 'framework' or isinstance(data__category, str) and data__category == 'cli' or isinstance(data__category, str) and data__category == 'api' or isinstance(data__category, str) and data__category == 'scripts' or isinstance(data__category, str) and data__category == 'ai' or isinstance(data__category, str) and data__category == 'awesome-list' or isinstance(data__category, str) and data__category == 'os' or isinstance(data__category, str) and data__category == 'other'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".category must be one of ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']", value=data__category, name="" + (name_prefix or "data") + ".category", definition={'type': 'string', 'enum': ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']}, rule='enum')
+        if "source" in data_keys:
+            data_keys.remove("source")
+            data__source = data["source"]
+            if not isinstance(data__source, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be object", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, rule='type')
+            data__source_is_dict = isinstance(data__source, dict)
+            if data__source_is_dict:
+                data__source__missing_keys = set(['platform', 'url_repository', 'license', 'language']) - data__source.keys()
+                if data__source__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must contain " + (str(sorted(data__source__missing_keys)) + " properties"), value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, rule='required')
+                data__source_keys = set(data__source.keys())
+                if "platform" in data__source_keys:
+                    data__source_keys.remove("platform")
+                    data__source__platform = data__source["platform"]
+                    if not isinstance(data__source__platform, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.platform must be string", value=data__source__platform, name="" + (name_prefix or "data") + ".source.platform", definition={'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, rule='type')
+                    if not (isinstance(data__source__platform, str) and data__source__platform == 'GitHub' or isinstance(data__source__platform, str) and data__source__platform == 'GitLab' or isinstance(data__source__platform, str) and data__source__platform == 'Bitbucket' or isinstance(data__source__platform, str) and data__source__platform == 'Gitea' or isinstance(data__source__platform, str) and data__source__platform == 'Codeberg' or isinstance(data__source__platform, str) and data__source__platform == 'Other'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.platform must be one of ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']", value=data__source__platform, name="" + (name_prefix or "data") + ".source.platform", definition={'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, rule='enum')
+                if "url_repository" in data__source_keys:
+                    data__source_keys.remove("url_repository")
+                    data__source__urlrepository = data__source["url_repository"]
+                    if not isinstance(data__source__urlrepository, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.url_repository must be string", value=data__source__urlrepository, name="" + (name_prefix or "data") + ".source.url_repository", definition={'type': 'string', 'format': 'uri'}, rule='type')
+                    if isinstance(data__source__urlrepository, str):
+                        if not REGEX_PATTERNS["uri_re_pattern"].match(data__source__urlrepository):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.url_repository must be uri", value=data__source__urlrepository, name="" + (name_prefix or "data") + ".source.url_repository", definition={'type': 'string', 'format': 'uri'}, rule='format')
+                if "url_documentation" in data__source_keys:
+                    data__source_keys.remove("url_documentation")
+                    data__source__urldocumentation = data__source["url_documentation"]
+                    if not isinstance(data__source__urldocumentation, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.url_documentation must be string", value=data__source__urldocumentation, name="" + (name_prefix or "data") + ".source.url_documentation", definition={'type': 'string', 'format': 'uri'}, rule='type')
+                    if isinstance(data__source__urldocumentation, str):
+                        if not REGEX_PATTERNS["uri_re_pattern"].match(data__source__urldocumentation):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.url_documentation must be uri", value=data__source__urldocumentation, name="" + (name_prefix or "data") + ".source.url_documentation", definition={'type': 'string', 'format': 'uri'}, rule='format')
+                if "license" in data__source_keys:
+                    data__source_keys.remove("license")
+                    data__source__license = data__source["license"]
+                    if not isinstance(data__source__license, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.license must be string", value=data__source__license, name="" + (name_prefix or "data") + ".source.license", definition={'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, rule='type')
+                    if not (isinstance(data__source__license, str) and data__source__license == 'Source-available' or isinstance(data__source__license, str) and data__source__license == '0BSD' or isinstance(data__source__license, str) and data__source__license == 'BSD-1-Clause' or isinstance(data__source__license, str) and data__source__license == 'BSD-2-Clause' or isinstance(data__source__license, str) and data__source__license == 'BSD-3-Clause' or isinstance(data__source__license, str) and data__source__license == 'AFL-3.0' or isinstance(data__source__license, str) and data__source__license == 'APL-1.0' or isinstance(data__source__license, str) and data__source__license == 'Apache-1.1' or isinstance(data__source__license, str) and data__source__license == 'Apache-2.0' or isinstance(data__source__license, str) and data__source__license == 'APSL-2.0' or isinstance(data__source__license, str) and data__source__license == 'Artistic-1.0' or isinstance(data__source__license, str) and data__source__license == 'Artistic-2.0' or isinstance(data__source__license, str) and data__source__license == 'AAL' or isinstance(data__source__license, str) and data__source__license == 'BSL-1.0' or isinstance(data__source__license, str) and data__source__license == '3-clause BSD License' or isinstance(data__source__license, str) and data__source__license == '2-clause BSD License' or isinstance(data__source__license, str) and data__source__license == '1-clause BSD License' or isinstance(data__source__license, str) and data__source__license == '0-clause BSD license' or isinstance(data__source__license, str) and data__source__license == 'BSD-3-Clause-LBNL' or isinstance(data__source__license, str) and data__source__license == 'BSD-2-Clause-Patent' or isinstance(data__source__license, str) and data__source__license == 'Creative Commons' or isinstance(data__source__license, str) and data__source__license == 'CERN Open Hardware Licence Version 2 - Permissive' or isinstance(data__source__license, str) and data__source__license == 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal' or isinstance(data__source__license, str) and data__source__license == 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal' or isinstance(data__source__license, str) and data__source__license == 'CECILL-2.1' or isinstance(data__source__license, str) and data__source__license == 'CDDL-1.0' or isinstance(data__source__license, str) and data__source__license == 'CPAL-1.0' or isinstance(data__source__license, str) and data__source__license == 'CPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'CATOSL-1.1' or isinstance(data__source__license, str) and data__source__license == 'Coopyleft' or isinstance(data__source__license, str) and data__source__license == 'CopyFair' or isinstance(data__source__license, str) and data__source__license == 'CSL' or isinstance(data__source__license, str) and data__source__license == 'CAL-1.0' or isinstance(data__source__license, str) and data__source__license == 'EPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'EPL-2.0' or isinstance(data__source__license, str) and data__source__license == 'eCos-2.0' or isinstance(data__source__license, str) and data__source__license == 'ECL-1.0' or isinstance(data__source__license, str) and data__source__license == 'ECL-2.0' or isinstance(data__source__license, str) and data__source__license == 'EFL-1.0' or isinstance(data__source__license, str) and data__source__license == 'EFL-2.0' or isinstance(data__source__license, str) and data__source__license == 'Entessa' or isinstance(data__source__license, str) and data__source__license == 'EUDatagrid' or isinstance(data__source__license, str) and data__source__license == 'EUPL-1.2' or isinstance(data__source__license, str) and data__source__license == 'FairSource' or isinstance(data__source__license, str) and data__source__license == 'Frameworx-1.0' or isinstance(data__source__license, str) and data__source__license == '0BSD' or isinstance(data__source__license, str) and data__source__license == 'AGPL-3.0' or isinstance(data__source__license, str) and data__source__license == 'GPL-2.0' or isinstance(data__source__license, str) and data__source__license == 'GPL-3.0' or isinstance(data__source__license, str) and data__source__license == 'LGPL-2.1' or isinstance(data__source__license, str) and data__source__license == 'LGPL-3.0' or isinstance(data__source__license, str) and data__source__license == 'HPND' or isinstance(data__source__license, str) and data__source__license == 'IPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'IPA' or isinstance(data__source__license, str) and data__source__license == 'ISC' or isinstance(data__source__license, str) and data__source__license == 'Jam' or isinstance(data__source__license, str) and data__source__license == 'LPPL-1.3c' or isinstance(data__source__license, str) and data__source__license == 'BSD-3-Clause-LBNL' or isinstance(data__source__license, str) and data__source__license == 'LiLiQ-P' or isinstance(data__source__license, str) and data__source__license == 'LiLiQ-R' or isinstance(data__source__license, str) and data__source__license == 'LiLiQ-R+' or isinstance(data__source__license, str) and data__source__license == 'LPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'LPL-1.02' or isinstance(data__source__license, str) and data__source__license == 'MS-PL' or isinstance(data__source__license, str) and data__source__license == 'MS-RL' or isinstance(data__source__license, str) and data__source__license == 'MirOS' or isinstance(data__source__license, str) and data__source__license == 'MIT' or isinstance(data__source__license, str) and data__source__license == 'MIT-0' or isinstance(data__source__license, str) and data__source__license == 'Motosoto' or isinstance(data__source__license, str) and data__source__license == 'MPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'MPL-1.1' or isinstance(data__source__license, str) and data__source__license == 'MPL-2.0' or isinstance(data__source__license, str) and data__source__license == 'MulanPSL' or isinstance(data__source__license, str) and data__source__license == 'Multics' or isinstance(data__source__license, str) and data__source__license == 'NASA-1.3' or isinstance(data__source__license, str) and data__source__license == 'Naumen' or isinstance(data__source__license, str) and data__source__license == 'NGPL' or isinstance(data__source__license, str) and data__source__license == 'NPOSL-3.0' or isinstance(data__source__license, str) and data__source__license == 'NTP' or isinstance(data__source__license, str) and data__source__license == 'OCLC-2.0' or isinstance(data__source__license, str) and data__source__license == 'OGTSL' or isinstance(data__source__license, str) and data__source__license == 'OSL-1.0' or isinstance(data__source__license, str) and data__source__license == 'OSL-2.1' or isinstance(data__source__license, str) and data__source__license == 'OSL-3.0' or isinstance(data__source__license, str) and data__source__license == 'OLDAP-2.8' or isinstance(data__source__license, str) and data__source__license == 'QPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'RPSL-1.0' or isinstance(data__source__license, str) and data__source__license == 'RPL-1.1' or isinstance(data__source__license, str) and data__source__license == 'RPL-1.5' or isinstance(data__source__license, str) and data__source__license == 'RSCPL' or isinstance(data__source__license, str) and data__source__license == 'OFL-1.1' or isinstance(data__source__license, str) and data__source__license == 'PPL' or isinstance(data__source__license, str) and data__source__license == 'SimPL-2.0' or isinstance(data__source__license, str) and data__source__license == 'Sleepycat' or isinstance(data__source__license, str) and data__source__license == 'SPL-1.0' or isinstance(data__source__license, str) and data__source__license == 'Watcom-1.0' or isinstance(data__source__license, str) and data__source__license == 'UPL' or isinstance(data__source__license, str) and data__source__license == 'NCSA' or isinstance(data__source__license, str) and data__source__license == 'Upstream Compatibility License v1.0' or isinstance(data__source__license, str) and data__source__license == 'Unicode Data Files and Software License' or isinstance(data__source__license, str) and data__source__license == 'Unlicense' or isinstance(data__source__license, str) and data__source__license == 'VSL-1.0' or isinstance(data__source__license, str) and data__source__license == 'W3C' or isinstance(data__source__license, str) and data__source__license == 'WXwindows' or isinstance(data__source__license, str) and data__source__license == 'Xnet' or isinstance(data__source__license, str) and data__source__license == '0BSD' or isinstance(data__source__license, str) and data__source__license == 'ZPL-2.0' or isinstance(data__source__license, str) and data__source__license == 'ZPL-2.1' or isinstance(data__source__license, str) and data__source__license == 'Zlib'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.license must be one of ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']", value=data__source__license, name="" + (name_prefix or "data") + ".source.license", definition={'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, rule='enum')
+                if "language" in data__source_keys:
+                    data__source_keys.remove("language")
+                    data__source__language = data__source["language"]
+                    if not isinstance(data__source__language, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.language must be string", value=data__source__language, name="" + (name_prefix or "data") + ".source.language", definition={'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}, rule='type')
+                    if not (isinstance(data__source__language, str) and data__source__language == 'C' or isinstance(data__source__language, str) and data__source__language == 'Bash' or isinstance(data__source__language, str) and data__source__language == 'Shell' or isinstance(data__source__language, str) and data__source__language == 'HTML' or isinstance(data__source__language, str) and data__source__language == 'CSS' or isinstance(data__source__language, str) and data__source__language == 'JavaScript' or isinstance(data__source__language, str) and data__source__language == 'Java' or isinstance(data__source__language, str) and data__source__language == 'Python' or isinstance(data__source__language, str) and data__source__language == 'PHP' or isinstance(data__source__language, str) and data__source__language == 'C++' or isinstance(data__source__language, str) and data__source__language == 'C#' or isinstance(data__source__language, str) and data__source__language == 'SQL' or isinstance(data__source__language, str) and data__source__language == 'Perl' or isinstance(data__source__language, str) and data__source__language == 'Pascal' or isinstance(data__source__language, str) and data__source__language == 'Ruby' or isinstance(data__source__language, str) and data__source__language == 'Lua' or isinstance(data__source__language, str) and data__source__language == 'BASIC' or isinstance(data__source__language, str) and data__source__language == 'Fortran' or isinstance(data__source__language, str) and data__source__language == 'assembly' or isinstance(data__source__language, str) and data__source__language == 'MATLAB' or isinstance(data__source__language, str) and data__source__language == 'Lisp' or isinstance(data__source__language, str) and data__source__language == 'COBOL' or isinstance(data__source__language, str) and data__source__language == 'R' or isinstance(data__source__language, str) and data__source__language == 'Ada' or isinstance(data__source__language, str) and data__source__language == 'Haskell' or isinstance(data__source__language, str) and data__source__language == 'Prolog' or isinstance(data__source__language, str) and data__source__language == 'Go' or isinstance(data__source__language, str) and data__source__language == 'Scratch' or isinstance(data__source__language, str) and data__source__language == 'Visual Basic' or isinstance(data__source__language, str) and data__source__language == 'ALGOL' or isinstance(data__source__language, str) and data__source__language == 'Kotlin' or isinstance(data__source__language, str) and data__source__language == 'Rust' or isinstance(data__source__language, str) and data__source__language == 'Swift' or isinstance(data__source__language, str) and data__source__language == 'Objective-C' or isinstance(data__source__language, str) and data__source__language == 'Scala' or isinstance(data__source__language, str) and data__source__language == 'TeX' or isinstance(data__source__language, str) and data__source__language == 'TypeScript' or isinstance(data__source__language, str) and data__source__language == 'HCL' or isinstance(data__source__language, str) and data__source__language == 'Dart' or isinstance(data__source__language, str) and data__source__language == 'Elixir' or isinstance(data__source__language, str) and data__source__language == 'Erlang' or isinstance(data__source__language, str) and data__source__language == 'F#' or isinstance(data__source__language, str) and data__source__language == 'Julia' or isinstance(data__source__language, str) and data__source__language == 'Elm' or isinstance(data__source__language, str) and data__source__language == 'Other'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.language must be one of ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']", value=data__source__language, name="" + (name_prefix or "data") + ".source.language", definition={'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}, rule='enum')
+                if data__source_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must not contain "+str(data__source_keys)+" properties", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, rule='additionalProperties')
+        if "owner" in data_keys:
+            data_keys.remove("owner")
+            data__owner = data["owner"]
+            if not isinstance(data__owner, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner must be object", value=data__owner, name="" + (name_prefix or "data") + ".owner", definition={'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, rule='type')
+            data__owner_is_dict = isinstance(data__owner, dict)
+            if data__owner_is_dict:
+                data__owner__missing_keys = set(['name', 'type']) - data__owner.keys()
+                if data__owner__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner must contain " + (str(sorted(data__owner__missing_keys)) + " properties"), value=data__owner, name="" + (name_prefix or "data") + ".owner", definition={'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, rule='required')
+                data__owner_keys = set(data__owner.keys())
+                if "name" in data__owner_keys:
+                    data__owner_keys.remove("name")
+                    data__owner__name = data__owner["name"]
+                    if not isinstance(data__owner__name, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.name must be string", value=data__owner__name, name="" + (name_prefix or "data") + ".owner.name", definition={'type': 'string'}, rule='type')
+                if "type" in data__owner_keys:
+                    data__owner_keys.remove("type")
+                    data__owner__type = data__owner["type"]
+                    if not isinstance(data__owner__type, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.type must be string", value=data__owner__type, name="" + (name_prefix or "data") + ".owner.type", definition={'type': 'string', 'enum': ['individual', 'community', 'organization']}, rule='type')
+                    if not (isinstance(data__owner__type, str) and data__owner__type == 'individual' or isinstance(data__owner__type, str) and data__owner__type == 'community' or isinstance(data__owner__type, str) and data__owner__type == 'organization'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.type must be one of ['individual', 'community', 'organization']", value=data__owner__type, name="" + (name_prefix or "data") + ".owner.type", definition={'type': 'string', 'enum': ['individual', 'community', 'organization']}, rule='enum')
+                if "description" in data__owner_keys:
+                    data__owner_keys.remove("description")
+                    data__owner__description = data__owner["description"]
+                    if not isinstance(data__owner__description, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.description must be string", value=data__owner__description, name="" + (name_prefix or "data") + ".owner.description", definition={'type': 'string'}, rule='type')
+                if "tags" in data__owner_keys:
+                    data__owner_keys.remove("tags")
+                    data__owner__tags = data__owner["tags"]
+                    if not isinstance(data__owner__tags, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags must be array", value=data__owner__tags, name="" + (name_prefix or "data") + ".owner.tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='type')
+                    data__owner__tags_is_list = isinstance(data__owner__tags, (list, tuple))
+                    if data__owner__tags_is_list:
+                        data__owner__tags_len = len(data__owner__tags)
+                        if data__owner__tags_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags must contain at least 1 items", value=data__owner__tags, name="" + (name_prefix or "data") + ".owner.tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='minItems')
+                        if data__owner__tags_len > 10:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags must contain less than or equal to 10 items", value=data__owner__tags, name="" + (name_prefix or "data") + ".owner.tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='maxItems')
+                        def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                        if data__owner__tags_len > len(set(fn(data__owner__tags_x) for data__owner__tags_x in data__owner__tags)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags must contain unique items", value=data__owner__tags, name="" + (name_prefix or "data") + ".owner.tags", definition={'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, rule='uniqueItems')
+                        for data__owner__tags_x, data__owner__tags_item in enumerate(data__owner__tags):
+                            if not isinstance(data__owner__tags_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags[{data__owner__tags_x}]".format(**locals()) + " must be string", value=data__owner__tags_item, name="" + (name_prefix or "data") + ".owner.tags[{data__owner__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 24}, rule='type')
+                            if isinstance(data__owner__tags_item, str):
+                                data__owner__tags_item_len = len(data__owner__tags_item)
+                                if data__owner__tags_item_len > 24:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.tags[{data__owner__tags_x}]".format(**locals()) + " must be shorter than or equal to 24 characters", value=data__owner__tags_item, name="" + (name_prefix or "data") + ".owner.tags[{data__owner__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 24}, rule='maxLength')
+                if "url_website" in data__owner_keys:
+                    data__owner_keys.remove("url_website")
+                    data__owner__urlwebsite = data__owner["url_website"]
+                    if not isinstance(data__owner__urlwebsite, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.url_website must be string or null", value=data__owner__urlwebsite, name="" + (name_prefix or "data") + ".owner.url_website", definition={'type': ['string', 'null'], 'format': 'uri'}, rule='type')
+                    if isinstance(data__owner__urlwebsite, str):
+                        if not REGEX_PATTERNS["uri_re_pattern"].match(data__owner__urlwebsite):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.url_website must be uri", value=data__owner__urlwebsite, name="" + (name_prefix or "data") + ".owner.url_website", definition={'type': ['string', 'null'], 'format': 'uri'}, rule='format')
+                if "is_a_startup" in data__owner_keys:
+                    data__owner_keys.remove("is_a_startup")
+                    data__owner__isastartup = data__owner["is_a_startup"]
+                    if not isinstance(data__owner__isastartup, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner.is_a_startup must be boolean", value=data__owner__isastartup, name="" + (name_prefix or "data") + ".owner.is_a_startup", definition={'type': 'boolean'}, rule='type')
+                if data__owner_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".owner must not contain "+str(data__owner_keys)+" properties", value=data__owner, name="" + (name_prefix or "data") + ".owner", definition={'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, rule='additionalProperties')
+        if "metadata" in data_keys:
+            data_keys.remove("metadata")
+            data__metadata = data["metadata"]
+            if not isinstance(data__metadata, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata must be object", value=data__metadata, name="" + (name_prefix or "data") + ".metadata", definition={'type': 'object', 'properties': {'filename': {'type': 'string'}, 'created_at': {'type': 'string', 'format': 'date-time'}}, 'required': ['created_at', 'filename'], 'additionalProperties': True}, rule='type')
+            data__metadata_is_dict = isinstance(data__metadata, dict)
+            if data__metadata_is_dict:
+                data__metadata__missing_keys = set(['created_at', 'filename']) - data__metadata.keys()
+                if data__metadata__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata must contain " + (str(sorted(data__metadata__missing_keys)) + " properties"), value=data__metadata, name="" + (name_prefix or "data") + ".metadata", definition={'type': 'object', 'properties': {'filename': {'type': 'string'}, 'created_at': {'type': 'string', 'format': 'date-time'}}, 'required': ['created_at', 'filename'], 'additionalProperties': True}, rule='required')
+                data__metadata_keys = set(data__metadata.keys())
+                if "filename" in data__metadata_keys:
+                    data__metadata_keys.remove("filename")
+                    data__metadata__filename = data__metadata["filename"]
+                    if not isinstance(data__metadata__filename, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.filename must be string", value=data__metadata__filename, name="" + (name_prefix or "data") + ".metadata.filename", definition={'type': 'string'}, rule='type')
+                if "created_at" in data__metadata_keys:
+                    data__metadata_keys.remove("created_at")
+                    data__metadata__createdat = data__metadata["created_at"]
+                    if not isinstance(data__metadata__createdat, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.created_at must be string", value=data__metadata__createdat, name="" + (name_prefix or "data") + ".metadata.created_at", definition={'type': 'string', 'format': 'date-time'}, rule='type')
+                    if isinstance(data__metadata__createdat, str):
+                        if not REGEX_PATTERNS["date-time_re_pattern"].match(data__metadata__createdat):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.created_at must be date-time", value=data__metadata__createdat, name="" + (name_prefix or "data") + ".metadata.created_at", definition={'type': 'string', 'format': 'date-time'}, rule='format')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2019-09/schema', 'type': 'object', 'properties': {'name': {'type': 'string'}, 'description': {'type': 'string', 'maxLength': 512}, 'country': {'type': 'array', 'minItems': 1, 'maxItems': 3, 'uniqueItems': True, 'items': {'type': 'string', 'enum': ['Italy', 'France', 'Germany', 'Spain', 'Poland', 'Netherlands', 'Belgium', 'Sweden', 'Austria', 'Czech Republic', 'Denmark', 'Finland', 'Greece', 'Hungary', 'Ireland', 'Croatia', 'Lithuania', 'Latvia', 'Slovakia', 'Slovenia', 'Estonia', 'Portugal', 'Bulgaria', 'Romania', 'Luxembourg', 'Malta', 'Cyprus', 'United Kingdom']}}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'category': {'type': 'string', 'enum': ['app', 'saas', 'paas', 'faas', 'package', 'library', 'learning', 'language', 'framework', 'cli', 'api', 'scripts', 'ai', 'awesome-list', 'os', 'other']}, 'source': {'type': 'object', 'properties': {'platform': {'type': 'string', 'enum': ['GitHub', 'GitLab', 'Bitbucket', 'Gitea', 'Codeberg', 'Other']}, 'url_repository': {'type': 'string', 'format': 'uri'}, 'url_documentation': {'type': 'string', 'format': 'uri'}, 'license': {'type': 'string', 'enum': ['Source-available', '0BSD', 'BSD-1-Clause', 'BSD-2-Clause', 'BSD-3-Clause', 'AFL-3.0', 'APL-1.0', 'Apache-1.1', 'Apache-2.0', 'APSL-2.0', 'Artistic-1.0', 'Artistic-2.0', 'AAL', 'BSL-1.0', '3-clause BSD License', '2-clause BSD License', '1-clause BSD License', '0-clause BSD license', 'BSD-3-Clause-LBNL', 'BSD-2-Clause-Patent', 'Creative Commons', 'CERN Open Hardware Licence Version 2 - Permissive', 'CERN Open Hardware Licence Version 2 - Weakly Reciprocal', 'CERN Open Hardware Licence Version 2 - Strongly Reciprocal', 'CECILL-2.1', 'CDDL-1.0', 'CPAL-1.0', 'CPL-1.0', 'CATOSL-1.1', 'Coopyleft', 'CopyFair', 'CSL', 'CAL-1.0', 'EPL-1.0', 'EPL-2.0', 'eCos-2.0', 'ECL-1.0', 'ECL-2.0', 'EFL-1.0', 'EFL-2.0', 'Entessa', 'EUDatagrid', 'EUPL-1.2', 'FairSource', 'Frameworx-1.0', '0BSD', 'AGPL-3.0', 'GPL-2.0', 'GPL-3.0', 'LGPL-2.1', 'LGPL-3.0', 'HPND', 'IPL-1.0', 'IPA', 'ISC', 'Jam', 'LPPL-1.3c', 'BSD-3-Clause-LBNL', 'LiLiQ-P', 'LiLiQ-R', 'LiLiQ-R+', 'LPL-1.0', 'LPL-1.02', 'MS-PL', 'MS-RL', 'MirOS', 'MIT', 'MIT-0', 'Motosoto', 'MPL-1.0', 'MPL-1.1', 'MPL-2.0', 'MulanPSL', 'Multics', 'NASA-1.3', 'Naumen', 'NGPL', 'NPOSL-3.0', 'NTP', 'OCLC-2.0', 'OGTSL', 'OSL-1.0', 'OSL-2.1', 'OSL-3.0', 'OLDAP-2.8', 'QPL-1.0', 'RPSL-1.0', 'RPL-1.1', 'RPL-1.5', 'RSCPL', 'OFL-1.1', 'PPL', 'SimPL-2.0', 'Sleepycat', 'SPL-1.0', 'Watcom-1.0', 'UPL', 'NCSA', 'Upstream Compatibility License v1.0', 'Unicode Data Files and Software License', 'Unlicense', 'VSL-1.0', 'W3C', 'WXwindows', 'Xnet', '0BSD', 'ZPL-2.0', 'ZPL-2.1', 'Zlib']}, 'language': {'type': 'string', 'enum': ['C', 'Bash', 'Shell', 'HTML', 'CSS', 'JavaScript', 'Java', 'Python', 'PHP', 'C++', 'C#', 'SQL', 'Perl', 'Pascal', 'Ruby', 'Lua', 'BASIC', 'Fortran', 'assembly', 'MATLAB', 'Lisp', 'COBOL', 'R', 'Ada', 'Haskell', 'Prolog', 'Go', 'Scratch', 'Visual Basic', 'ALGOL', 'Kotlin', 'Rust', 'Swift', 'Objective-C', 'Scala', 'TeX', 'TypeScript', 'HCL', 'Dart', 'Elixir', 'Erlang', 'F#', 'Julia', 'Elm', 'Other']}}, 'required': ['platform', 'url_repository', 'license', 'language'], 'additionalProperties': False}, 'owner': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'type': {'type': 'string', 'enum': ['individual', 'community', 'organization']}, 'description': {'type': 'string'}, 'tags': {'type': 'array', 'minItems': 1, 'maxItems': 10, 'uniqueItems': True, 'items': {'type': 'string', 'maxLength': 24}}, 'url_website': {'type': ['string', 'null'], 'format': 'uri'}, 'is_a_startup': {'type': 'boolean'}}, 'required': ['name', 'type'], 'additionalProperties': False}, 'metadata': {'type': 'object', 'properties': {'filename': {'type': 'string'}, 'created_at': {'type': 'string', 'format': 'date-time'}}, 'required': ['created_at', 'filename'], 'additionalProperties': True}}, 'required': ['name', 'description', 'category', 'source', 'owner'], 'additionalProperties': False}, rule='additionalProperties')
+    return data
\ No newline at end of file
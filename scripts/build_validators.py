@@ -0,0 +1,42 @@
+"""Generate the pre-compiled JSON Schema validators used by scripts/validator.py.
+
+Run `just build-validators` after editing a file under schemas/ or upgrading
+fastjsonschema.
+"""
+
+import os
+import sys
+
+import fastjsonschema
+
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from validator import JSONSCHEMA_OPTIONS, get_jsonschema, get_jsonschema_sha256
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_NAMES = ("project",)
+
+
+def build(name: str) -> str:
+    code = fastjsonschema.compile_to_code(
+        definition=get_jsonschema(name), **JSONSCHEMA_OPTIONS
+    )
+    output_path = os.path.join(SCRIPTS_DIR, f"_{name}_validator.py")
+    header = (
+        f'"""Generated by scripts/build_validators.py from schemas/{name}.json. Do not edit."""\n\n'
+        f'SCHEMA_SHA256 = "{get_jsonschema_sha256(name)}"\n'
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(header + code)
+    return output_path
+
+
+def main() -> int:
+    for name in SCHEMA_NAMES:
+        print(f"[INFO] Generated {build(name)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
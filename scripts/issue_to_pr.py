@@ -2,10 +2,10 @@
 
 import argparse
 import base64
-import json
 import os
 import re
 import sys
+from collections.abc import Callable
 from typing import Any
 
 import httpx
@@ -13,6 +13,7 @@ import httpx
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from utils import (
+    dump_json,
     generate_filename,
     get_timestamp,
     sanitize_description,
@@ -23,6 +24,8 @@ from validator import ProjectValidator
 
 
 MAX_TAGS = 10
+# repository-relative, POSIX-style: used both in metadata.filepath and the contents API
+PROJECTS_DIR = "awesome/projects"
 HTTP_NOT_FOUND = 404
 HTTP_UNPROCESSABLE_ENTITY = 422
 
@@ -47,6 +50,16 @@ ISSUE_FIELDS: dict[str, str] = {
     "tags": "Tags",
 }
 
+# (parsed key, parent key in the project JSON, target key, sanitizer) for
+# fields that are only written when the issue provides them
+OPTIONAL_FIELDS: tuple[tuple[str, str, str, Callable[[str], str]], ...] = (
+    ("owner_description", "owner", "description", sanitize_description),
+    ("owner_website", "owner", "url_website", sanitize_text),
+    ("url_documentation", "source", "url_documentation", sanitize_text),
+)
+
+ISSUE_SECTION_RE = re.compile(r"### (.+?)\s*\n\n(.+?)(?=\n### |\Z)", re.DOTALL)
+
 
 def parse_field(body: str, label: str) -> str | None:
     pattern = rf"### {re.escape(label)}\s*\n\n(.+?)(?=\n### |\Z)"
@@ -59,7 +72,7 @@ def parse_field(body: str, label: str) -> str | None:
 
 def parse_issue_body(body: str) -> dict[str, Any]:
     sections: dict[str, str] = {}
-    for match in re.finditer(r"### (.+?)\s*\n\n(.+?)(?=\n### |\Z)", body, re.DOTALL):
+    for match in ISSUE_SECTION_RE.finditer(body):
         sections[match.group(1).strip()] = match.group(2).strip()
 
     result: dict[str, Any] = {}
@@ -108,23 +121,18 @@ def build_project_json(parsed: dict[str, Any], filename: str) -> dict[str, Any]:
         },
         "metadata": {
             "filename": filename,
-            "filepath": f"awesome/projects/{filename}",
+            "filepath": f"{PROJECTS_DIR}/{filename}",
             "created_at": get_timestamp(),
         },
     }
 
-    if parsed.get("owner_description"):
-        data["owner"]["description"] = sanitize_description(parsed["owner_description"])
-
-    if parsed.get("owner_website"):
-        data["owner"]["url_website"] = sanitize_text(parsed["owner_website"])
+    for key, parent, target, sanitize in OPTIONAL_FIELDS:
+        if parsed.get(key):
+            data[parent][target] = sanitize(parsed[key])
 
     if parsed.get("is_a_startup") is not None:
         data["owner"]["is_a_startup"] = parsed["is_a_startup"] == "Yes"
 
-    if parsed.get("url_documentation"):
-        data["source"]["url_documentation"] = sanitize_text(parsed["url_documentation"])
-
     tags = normalize_tags(parsed.get("tags"))
     if tags:
         data["tags"] = tags
@@ -172,7 +180,7 @@ def create_pr(
     repo: str,
 ) -> str:
     branch_name = f"submission/issue-{issue_number}"
-    file_path = f"awesome/projects/{filename}"
+    file_path = f"{PROJECTS_DIR}/{filename}"
     project_name = json_data["name"]
 
     ref_data = gh.request("GET", f"/repos/{repo}/git/ref/heads/main")
@@ -206,9 +214,7 @@ def create_pr(
         if exc.response.status_code != HTTP_NOT_FOUND:
             raise
 
-    content_b64 = base64.b64encode(
-        (json.dumps(json_data, indent=2, ensure_ascii=False) + "\n").encode()
-    ).decode()
+    content_b64 = base64.b64encode(dump_json(json_data)).decode()
     put_body: dict[str, Any] = {
         "message": f"feat(awesome:projects): add {project_name} (closes #{issue_number})",
         "content": content_b64,
@@ -314,9 +320,8 @@ def main() -> int:
 
         if args.output_dir:
             output_path = os.path.join(args.output_dir, filename)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+            with open(output_path, "wb") as f:
+                f.write(dump_json(json_data))
             print(f"[INFO] Written submission to: {output_path}")
 
         if validate_only:
@@ -1,58 +1,116 @@
+import functools
 import hashlib
+import json
 import re
 import unicodedata
 from datetime import UTC, datetime
+from typing import Any
 
 
+try:
+    import orjson
+except ImportError:  # optional "speedups" extra
+    orjson = None
+
+
+# bound once: these run per codepoint on the non-ASCII paths
+_ud_category = unicodedata.category
+_ud_normalize = unicodedata.normalize
+
+_ASCII_CTRL_RE = re.compile(r"[\x00-\x1f\x7f]")
+_WS_RE = re.compile(r"\s+")
+_NAME_CHARS_RE = re.compile(r"[^\w\s\-\.'&]", re.UNICODE)
+_DESC_CHARS_RE = re.compile(r"[^\w\s\-\.,;:!?()'\"/&]", re.UNICODE)
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+_COLLAPSE_RE = re.compile(r"[\s_-]+")
+
+
+class _ControlCharTable(dict[int, str | int | None]):
+    """`str.translate` table dropping "C" category chars, filled lazily per codepoint."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = None if _ud_category(chr(codepoint))[0] == "C" else codepoint
+        self[codepoint] = value
+        return value
+
+
+# tabs and line breaks become spaces, every other control or format char is dropped
+_CONTROL_CHARS = _ControlCharTable({ord("\t"): " ", ord("\n"): " ", ord("\r"): " "})
+
+
+def _strip_accents(value: str) -> str:
+    return "".join(c for c in _ud_normalize("NFD", value) if _ud_category(c) != "Mn")
+
+
+# precomputed _strip_accents for Latin-1 and Latin Extended-A letters that fold
+# to ASCII ("é" -> "e"), which covers most European names in one translate pass
+_ACCENT_FOLD_TABLE = {
+    codepoint: folded
+    for codepoint in range(0x80, 0x180)
+    if (folded := _strip_accents(chr(codepoint))).isascii()
+}
+
+# countries, licenses, platforms, ... repeat across entities, so the pure
+# string helpers below are memoized; typed, so equal values of different types
+# (True, 1, 1.0) are cached apart and str() coercion still sees the original type
+_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
 def sanitize_text(value: str) -> str:
-    normalized = unicodedata.normalize("NFKC", str(value))
+    value = str(value)
+    # NFKC is the identity on ASCII, which is what most fields (URLs, licenses, ...) are
+    is_ascii = value.isascii()
+    normalized = value if is_ascii else _ud_normalize("NFKC", value)
 
     # handle both escaped sequences (e.g. from CSV) and real control chars
-    normalized = (
-        normalized.replace("\\t", " ")
-        .replace("\\n", " ")
-        .replace("\\r", " ")
-        .replace("\t", " ")
-        .replace("\n", " ")
-        .replace("\r", " ")
-    )
+    normalized = normalized.replace("\\t", " ").replace("\\n", " ").replace("\\r", " ")
 
-    normalized = "".join(
-        char for char in normalized if unicodedata.category(char)[0] != "C"
-    )
+    if is_ascii:
+        normalized = normalized.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+        normalized = _ASCII_CTRL_RE.sub("", normalized)
+    else:
+        normalized = normalized.translate(_CONTROL_CHARS)
 
-    return re.sub(r"\s+", " ", normalized).strip()
+    return _WS_RE.sub(" ", normalized).strip()
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
 def sanitize_name(value: str) -> str:
-    normalized = sanitize_text(value)
-    normalized = re.sub(r"[^\w\s\-\.'&]", "", normalized, flags=re.UNICODE)
-    return re.sub(r"\s+", " ", normalized).strip()
+    return _drop_chars(_NAME_CHARS_RE, sanitize_text(value))
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
 def sanitize_description(value: str) -> str:
-    normalized = sanitize_text(value)
-    normalized = re.sub(
-        r"[^\w\s\-\.,;:!?()'\"/&]",
-        "",
-        normalized,
-        flags=re.UNICODE,
-    )
-    return re.sub(r"\s+", " ", normalized).strip()
+    return _drop_chars(_DESC_CHARS_RE, sanitize_text(value))
 
 
+def _drop_chars(pattern: re.Pattern[str], text: str) -> str:
+    # text comes out of sanitize_text with whitespace already collapsed, so it
+    # only needs another pass when dropping chars left gaps behind
+    stripped, count = pattern.subn("", text)
+    if not count:
+        return stripped
+    return _WS_RE.sub(" ", stripped).strip()
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
 def normalize_name(name: str) -> str:
     normalized_name = sanitize_name(name)
 
-    # NFD decomposition strips combining marks (accents) without losing base letters
-    name_without_accents = "".join(
-        c
-        for c in unicodedata.normalize("NFD", normalized_name)
-        if unicodedata.category(c) != "Mn"
-    )
+    if not normalized_name.isascii():
+        normalized_name = normalized_name.translate(_ACCENT_FOLD_TABLE)
+
+    if not normalized_name.isascii():
+        # NFD decomposition strips combining marks (accents) without losing base letters
+        normalized_name = _strip_accents(normalized_name)
 
-    slug_base = re.sub(r"[^a-zA-Z0-9\s-]", "", name_without_accents)
-    slug_base = re.sub(r"[\s_-]+", "-", slug_base).strip("-")
+    return _slugify(normalized_name)
+
+
+def _slugify(value: str) -> str:
+    slug_base = _SLUG_RE.sub("", value)
+    slug_base = _COLLAPSE_RE.sub("-", slug_base).strip("-")
 
     if not slug_base:
         return "entity"
@@ -60,12 +118,37 @@ def normalize_name(name: str) -> str:
     return slug_base.lower()
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
 def generate_filename(name: str, unique_identifier: str) -> str:
     normalized_name = normalize_name(name)
-    unique_string = f"{normalized_name}:{unique_identifier}"
-    hash_suffix = hashlib.sha256(unique_string.encode()).hexdigest()[:6]
+    # hashes "{normalized_name}:{unique_identifier}" without building the joined
+    # string; slugs are ASCII by construction
+    digest = hashlib.sha256(normalized_name.encode("ascii"))
+    digest.update(b":")
+    digest.update(unique_identifier.encode())
+    # sha256 is kept so suffixes match the files already in awesome/; hexing only
+    # the first 3 bytes yields the same 6 chars as hexdigest()[:6]
+    hash_suffix = digest.digest()[:3].hex()
     return f"{normalized_name}-{hash_suffix}.json"
 
 
 def get_timestamp() -> str:
-    return datetime.now(UTC).isoformat()[:-13] + "Z"
+    # timespec pins the layout: plain isoformat() omits ".ffffff" on whole seconds
+    return datetime.now(UTC).isoformat(timespec="seconds")[:-6] + "Z"
+
+
+def load_json(content: bytes) -> Any:
+    """Parse a JSON document; decode errors are `json.JSONDecodeError` with either backend."""
+    if orjson is not None:
+        return orjson.loads(content)
+    # decode explicitly, json.loads(bytes) would also accept a BOM or UTF-16/32
+    return json.loads(content.decode("utf-8"))
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize an entity the way files under awesome/ are stored (2-space indent, UTF-8, trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode()
@@ -1,20 +1,67 @@
 """Validation module for awesome-european-opensource entities."""
 
-import json
+import functools
+import hashlib
+import importlib
 import os
+import pathlib
 import sys
+from collections.abc import Callable
+from operator import itemgetter
 from typing import Any
 
 import fastjsonschema
+from utils import load_json
 
 
-PROJECT_ROOTDIR = os.path.dirname(os.path.abspath(__file__).replace("scripts/", ""))
+PROJECT_ROOTDIR = str(pathlib.Path(__file__).resolve().parent.parent)
 
+# print one [VALIDATE] line per entity; errors, warnings and the summary always print
+VERBOSE = os.environ.get("VALIDATOR_VERBOSE") == "1"
 
+# Shared by compile_jsonschema and scripts/build_validators.py. The schemas use
+# "format" (uri, date-time) but no "default", so default filling is left out;
+# detailed exceptions stay on, their messages name the offending keys/values
+# and the extra arguments are only built when validation fails.
+JSONSCHEMA_OPTIONS: dict[str, Any] = {"use_default": False}
+
+
+def get_jsonschema_path(name: str) -> str:
+    return f"{PROJECT_ROOTDIR}/schemas/{name}.json"
+
+
+@functools.cache
 def get_jsonschema(name: str) -> dict[str, Any]:
-    schema_path = f"{PROJECT_ROOTDIR}/schemas/{name}.json"
-    with open(schema_path, encoding="utf-8") as f:
-        return json.load(f)
+    with open(get_jsonschema_path(name), "rb") as f:
+        return load_json(f.read())
+
+
+def get_jsonschema_sha256(name: str) -> str:
+    with open(get_jsonschema_path(name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@functools.cache
+def compile_jsonschema(name: str) -> Callable[[Any], Any]:
+    """Return the validation function for schema `name`, built once per process.
+
+    Prefers the module pre-generated by scripts/build_validators.py, which skips
+    the runtime compile. It is only used while its recorded hash still matches
+    schemas/<name>.json and it was generated by the installed fastjsonschema, so
+    a stale module falls back to compiling the schema.
+    """
+    try:
+        generated = importlib.import_module(f"_{name}_validator")
+    except ImportError:
+        generated = None
+
+    if (
+        getattr(generated, "SCHEMA_SHA256", None) == get_jsonschema_sha256(name)
+        and getattr(generated, "VERSION", None) == fastjsonschema.VERSION
+    ):
+        return generated.validate
+
+    return fastjsonschema.compile(definition=get_jsonschema(name), **JSONSCHEMA_OPTIONS)
 
 
 class Validator:
@@ -27,9 +74,7 @@ class Validator:
         if self.schema_name is None:
             raise NotImplementedError("schema_name must be defined in subclass")
 
-        self.schema_configuration = fastjsonschema.compile(
-            definition=get_jsonschema(self.schema_name)
-        )
+        self.schema_configuration = compile_jsonschema(self.schema_name)
         self.source_data: dict[str, dict[str, Any]] = {}
         self.metadata = {
             "success": 0,
@@ -46,16 +91,59 @@ class Validator:
         Raises:
             ValueError: If key is not "errors" or "warnings".
         """
-        if key not in ("errors", "warnings"):
+        if key == "errors":
+            self._save_error(name, message)
+        elif key == "warnings":
+            self._save_warning(name, message)
+        else:
             raise ValueError(f"Unsupported key '{key}' in save_state")
 
-        entry = {"name": name, "message": message}
-        self.metadata[key].append(entry)
+    def _save_error(self, name: str, message: str) -> None:
+        metadata = self.metadata
+        metadata["errors"].append({"name": name, "message": message})
+        metadata["failed"] += 1
 
-        if key == "errors":
-            self.metadata["failed"] += 1
-        elif key == "warnings":
-            self.metadata["warning"] += 1
+    def _save_warning(self, name: str, message: str) -> None:
+        metadata = self.metadata
+        metadata["warnings"].append({"name": name, "message": message})
+        metadata["warning"] += 1
+
+    def load(self, filename: str) -> dict[str, Any] | None:
+        """Parse a JSON file.
+
+        Returns:
+            The parsed data, or None (recorded as a warning) if the file does not exist.
+        """
+        # open() reports a missing path itself, no separate isfile() stat needed
+        try:
+            with open(filename, "rb") as f:
+                content = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            print(f"  [WARN] Not found {os.path.basename(filename)}")
+            self._save_warning(filename, f"File not found: {filename}")
+            return None
+
+        return load_json(content)
+
+    def _check_duplicate(self, data: dict[str, Any], entity_name: str) -> bool:
+        """Warn if the file `data` would be written to already exists.
+
+        Returns:
+            True if a duplicate was found (recorded as a warning).
+        """
+        metadata = data.get("metadata")
+        if not metadata or "filepath" not in metadata:
+            return False
+
+        if not os.path.isfile(os.path.join(PROJECT_ROOTDIR, metadata["filepath"])):
+            return False
+
+        warning_msg = (
+            f"Entity '{entity_name}' already exists. File: {metadata['filename']}"
+        )
+        print(f"  [WARN] {warning_msg}")
+        self._save_warning(entity_name, warning_msg)
+        return True
 
     def validate(
         self,
@@ -81,64 +169,37 @@ class Validator:
         if not filename and not data:
             raise ValueError("You must provide either filename or data")
 
-        if filename:
-            if not os.path.isfile(filename):
-                print(f"  [WARN] Not found {os.path.basename(filename)}")
-                self.save_state(filename, f"File not found: {filename}", "warnings")
-                return {}, None
+        # until the file is parsed, errors are reported under its name
+        entity_name = os.path.basename(filename) if filename else "Unknown"
 
-            with open(filename, encoding="utf-8") as f:
-                data = json.load(f)
+        try:
+            if filename:
+                data = self.load(filename)
+                if data is None:
+                    return {}, None
 
-        entity_name = data.get("name", "Unknown")
+            entity_name = data.get("name", entity_name)
 
-        try:
-            print(f"[VALIDATE] {entity_name}")
+            if VERBOSE:
+                print(f"[VALIDATE] {entity_name}")
 
-            if (
-                data.get("owner", {}).get("is_a_startup") is not None
-                and data["owner"]["is_a_startup"] == "Yes"
-            ):
-                data["owner"]["is_a_startup"] = True
-            else:
-                data["owner"]["is_a_startup"] = False
+            owner = data["owner"]
+            owner["is_a_startup"] = owner.get("is_a_startup") == "Yes"
 
             self.schema_configuration(data)
 
             # check_file_exists=False when validating existing files from directory
-            if (
-                check_file_exists
-                and "metadata" in data
-                and "filepath" in data["metadata"]
-            ):
-                relative_filepath = data["metadata"]["filepath"]
-                absolute_filepath = os.path.join(PROJECT_ROOTDIR, relative_filepath)
-
-                if os.path.isfile(absolute_filepath):
-                    warning_msg = (
-                        f"Entity '{entity_name}' already exists. "
-                        f"File: {data['metadata']['filename']}"
-                    )
-                    print(f"  [WARN] {warning_msg}")
-                    self.save_state(entity_name, warning_msg, "warnings")
-                    return data, None
+            if check_file_exists and self._check_duplicate(data, entity_name):
+                return data, None
 
             self.metadata["success"] += 1
             return data, None
 
-        except fastjsonschema.JsonSchemaException as e:
-            print(f"  [ERROR] {entity_name} - {e.message}")
-            self.save_state(entity_name, e.message)
-            return None, self.metadata["errors"]
-
-        except json.JSONDecodeError as e:
-            print(f"  [ERROR] {entity_name} - {e.msg}")
-            self.save_state(entity_name, e.msg)
-            return None, self.metadata["errors"]
-
         except Exception as e:
-            print(f"  [ERROR] {entity_name} - {str(e)}")
-            self.save_state(entity_name, str(e))
+            # JsonSchemaException carries .message, JSONDecodeError .msg
+            message = getattr(e, "message", None) or getattr(e, "msg", None) or str(e)
+            print(f"  [ERROR] {entity_name} - {message}")
+            self._save_error(entity_name, message)
             return None, self.metadata["errors"]
 
         finally:
@@ -151,26 +212,29 @@ class Validator:
             raise NotADirectoryError(f"Directory not found: {dirpath}")
 
         json_files = []
-        for entry in os.listdir(dirpath):
-            filepath = os.path.join(dirpath, entry)
-
-            if not os.path.isfile(filepath):
-                print(f"  [WARN] Skipping non-file: {entry}")
-                self.save_state(entry, "Not a file", "warnings")
-                continue
-
-            if not entry.endswith(".json"):
-                print(f"  [WARN] Skipping non-JSON file: {entry}")
-                self.save_state(
-                    entry, "Invalid file extension (expected .json)", "warnings"
-                )
-                continue
-
-            entity_id = entry.replace(".json", "")
-            json_files.append((entity_id, filepath))
-
-        # sorted for deterministic output; check_file_exists=False since these files already exist
-        for entity_id, filepath in sorted(json_files, key=lambda x: x[0]):
+        # DirEntry.is_file() answers from the directory listing, no stat per entry
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    print(f"  [WARN] Skipping non-file: {entry.name}")
+                    self._save_warning(entry.name, "Not a file")
+                    continue
+
+                if not entry.name.endswith(".json"):
+                    print(f"  [WARN] Skipping non-JSON file: {entry.name}")
+                    self._save_warning(
+                        entry.name, "Invalid file extension (expected .json)"
+                    )
+                    continue
+
+                # the .json suffix was checked above
+                json_files.append((entry.name[:-5], entry.path))
+
+        # sorted by entity id for deterministic output (not by file name, "a-b.json"
+        # sorts before "a.json"); check_file_exists=False since these files already exist
+        json_files.sort(key=itemgetter(0))
+
+        for entity_id, filepath in json_files:
             validated_data, _ = self.validate(
                 filename=filepath, check_file_exists=False
             )
@@ -182,23 +246,32 @@ class Validator:
     def print(self) -> None:
         entity_type = self.schema_name or "entities"
 
-        print(f"\n[INFO] === Validation Summary for {entity_type} ===")
-        print(f"[INFO] Total scanned: {self.metadata['total']}")
-        print(f"[INFO] Successful: {self.metadata['success']}")
-        print(f"[INFO] Failed: {self.metadata['failed']}")
-        print(f"[INFO] Warnings: {self.metadata['warning']}")
+        # built up front and written once, the error/warning lists can be long
+        lines = [
+            f"\n[INFO] === Validation Summary for {entity_type} ===",
+            f"[INFO] Total scanned: {self.metadata['total']}",
+            f"[INFO] Successful: {self.metadata['success']}",
+            f"[INFO] Failed: {self.metadata['failed']}",
+            f"[INFO] Warnings: {self.metadata['warning']}",
+        ]
 
         if self.metadata["errors"]:
-            print("\n[ERROR] Validation Errors:")
-            for error in self.metadata["errors"]:
-                print(f"  ✗ {error['name']}: {error['message']}")
+            lines.append("\n[ERROR] Validation Errors:")
+            lines.extend(
+                f"  ✗ {error['name']}: {error['message']}"
+                for error in self.metadata["errors"]
+            )
         else:
-            print("\n[INFO] ✓ No validation errors found")
+            lines.append("\n[INFO] ✓ No validation errors found")
 
         if self.metadata["warnings"]:
-            print("\n[WARN] Warnings:")
-            for warning in self.metadata["warnings"]:
-                print(f"  ⚠ {warning['name']}: {warning['message']}")
+            lines.append("\n[WARN] Warnings:")
+            lines.extend(
+                f"  ⚠ {warning['name']}: {warning['message']}"
+                for warning in self.metadata["warnings"]
+            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run(self) -> None:
         if self.source_filepath is None:
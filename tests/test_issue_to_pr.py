@@ -260,6 +260,17 @@ class TestBuildProjectJson:
         data = build_project_json(parsed, "f.json")
         assert data["owner"]["description"] == "Great org"
 
+    def test_optional_owner_website_included(self):
+        parsed = self._parsed(owner_website="https://example.com")
+        data = build_project_json(parsed, "f.json")
+        assert data["owner"]["url_website"] == "https://example.com"
+
+    def test_optional_fields_omitted_when_missing(self):
+        data = build_project_json(self._parsed(), "f.json")
+        assert "description" not in data["owner"]
+        assert "url_website" not in data["owner"]
+        assert "url_documentation" not in data["source"]
+
     def test_optional_url_documentation_included(self):
         parsed = self._parsed(url_documentation="https://docs.example.com")
         data = build_project_json(parsed, "f.json")
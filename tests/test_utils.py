@@ -0,0 +1,171 @@
+"""Tests for scripts/utils.py"""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+import utils
+from utils import (
+    dump_json,
+    get_timestamp,
+    load_json,
+    normalize_name,
+    sanitize_description,
+    sanitize_name,
+    sanitize_text,
+)
+
+
+# ---------------------------------------------------------------------------
+# sanitize_text
+# ---------------------------------------------------------------------------
+
+
+class TestSanitizeText:
+    def test_collapses_whitespace_and_strips(self):
+        assert sanitize_text("  MIT   License \t") == "MIT License"
+
+    def test_replaces_escaped_sequences(self):
+        assert sanitize_text("line\\none\\ttwo\\rthree") == "line one two three"
+
+    def test_replaces_real_line_breaks(self):
+        assert sanitize_text("line\none\r\ntwo") == "line one two"
+
+    def test_drops_ascii_control_chars(self):
+        assert sanitize_text("Go\x00\x07\x0b\x1flang\x7f") == "Golang"
+
+    def test_drops_unicode_format_chars(self):
+        assert sanitize_text("Zero\u200bWidth\u00ad") == "ZeroWidth"
+
+    def test_applies_nfkc(self):
+        assert sanitize_text("ﬁle name") == "file name"
+
+    def test_ascii_and_unicode_paths_agree(self):
+        # the trailing "é" forces the NFKC path for the same ASCII prefix
+        value = "  a\x00b\\tc\x1fd\ne"
+        assert sanitize_text(value + "é") == sanitize_text(value) + "é"
+
+    def test_accepts_hashable_non_string_values(self):
+        assert sanitize_text(42) == "42"
+
+    def test_equal_values_of_other_types_are_cached_apart(self):
+        assert [sanitize_text(v) for v in (True, 1, 1.0)] == ["True", "1", "1.0"]
+        assert [sanitize_name(v) for v in (1.0, True)] == ["1.0", "True"]
+
+
+# ---------------------------------------------------------------------------
+# sanitize_name / sanitize_description
+# ---------------------------------------------------------------------------
+
+
+class TestSanitizeName:
+    def test_keeps_allowed_punctuation(self):
+        assert sanitize_name("Ben & Jerry's v1.0-beta") == "Ben & Jerry's v1.0-beta"
+
+    def test_drops_disallowed_chars(self):
+        assert sanitize_name("My <Tool>!") == "My Tool"
+
+
+class TestSanitizeDescription:
+    def test_keeps_sentence_punctuation(self):
+        text = 'A tool (CLI/API): fast, "simple"; really!?'
+        assert sanitize_description(text) == text
+
+    def test_drops_disallowed_chars(self):
+        assert sanitize_description("Tags: #a @b") == "Tags: a b"
+
+
+# ---------------------------------------------------------------------------
+# normalize_name
+# ---------------------------------------------------------------------------
+
+
+class TestNormalizeName:
+    def test_ascii_slug(self):
+        assert normalize_name("  My Cool--Tool! ") == "my-cool-tool"
+
+    def test_strips_accents(self):
+        assert normalize_name("Café Élan") == "cafe-elan"
+
+    def test_strips_accents_outside_latin_1(self):
+        # "Ṡ" and the combining acute are not in the fold table and go through NFD
+        assert normalize_name("Crème Ṡpace Ne\u0301on") == "creme-space-neon"
+
+    def test_drops_non_latin_letters(self):
+        assert normalize_name("Straße Ωmega") == "strae-mega"
+
+    def test_empty_slug_falls_back_to_entity(self):
+        assert normalize_name("!!!") == "entity"
+        assert normalize_name("日本") == "entity"
+
+
+# ---------------------------------------------------------------------------
+# dump_json
+# ---------------------------------------------------------------------------
+
+
+class TestDumpJson:
+    def test_matches_stored_file_layout(self):
+        data = {"name": "Café", "country": ["France"]}
+        expected = '{\n  "name": "Café",\n  "country": [\n    "France"\n  ]\n}\n'
+        assert dump_json(data) == expected.encode()
+
+    def test_stdlib_fallback_matches(self):
+        data = {"name": "Café", "tags": [], "owner": {"is_a_startup": False}}
+        expected = dump_json(data)
+        with patch("utils.orjson", None):
+            assert dump_json(data) == expected
+
+
+# ---------------------------------------------------------------------------
+# load_json
+# ---------------------------------------------------------------------------
+
+
+class TestLoadJson:
+    def test_parses_utf8_bytes(self):
+        assert load_json('{"name": "Café"}'.encode()) == {"name": "Café"}
+
+    def test_decode_error_is_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            load_json(b'{"name": ')
+
+    def test_stdlib_fallback_decode_error(self):
+        with patch("utils.orjson", None), pytest.raises(json.JSONDecodeError):
+            load_json(b'{"name": ')
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'\xef\xbb\xbf{"name": "Caf\xc3\xa9"}',
+            '{"name": "Café"}'.encode("utf-16"),
+        ],
+        ids=["utf-8-bom", "utf-16"],
+    )
+    @pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+    def test_rejects_non_plain_utf8(self, content, backend):
+        with (
+            patch("utils.orjson", None if backend == "stdlib" else utils.orjson),
+            pytest.raises(ValueError),
+        ):
+            load_json(content)
+
+
+# ---------------------------------------------------------------------------
+# get_timestamp
+# ---------------------------------------------------------------------------
+
+
+class TestGetTimestamp:
+    def test_drops_microseconds_and_uses_z_suffix(self):
+        with patch("utils.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(
+                2026, 3, 10, 11, 48, 54, 123456, tzinfo=UTC
+            )
+            assert get_timestamp() == "2026-03-10T11:48:54Z"
+
+    def test_whole_seconds(self):
+        with patch("utils.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 1, tzinfo=UTC)
+            assert get_timestamp() == "2026-01-01T00:00:00Z"
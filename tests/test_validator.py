@@ -0,0 +1,324 @@
+"""Tests for scripts/validator.py"""
+
+import copy
+import json
+import os
+
+import _project_validator
+import fastjsonschema
+import pytest
+from validator import (
+    PROJECT_ROOTDIR,
+    ProjectValidator,
+    compile_jsonschema,
+    get_jsonschema_sha256,
+)
+
+
+VALID_PROJECT = {
+    "name": "TestApp",
+    "description": "A test application for the catalog.",
+    "category": "app",
+    "country": ["Italy"],
+    "source": {
+        "platform": "GitHub",
+        "url_repository": "https://github.com/owner/testapp",
+        "license": "MIT",
+        "language": "Python",
+    },
+    "owner": {"name": "Owner", "type": "individual"},
+    "metadata": {
+        "filename": "testapp-abc123.json",
+        "filepath": "awesome/projects/testapp-abc123.json",
+        "created_at": "2026-01-01T00:00:00Z",
+    },
+}
+
+
+def _project(**overrides):
+    data = copy.deepcopy(VALID_PROJECT)
+    data.update(overrides)
+    return data
+
+
+def _write(dirpath, name, data):
+    (dirpath / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# schema compilation
+# ---------------------------------------------------------------------------
+
+
+class TestProjectRootdir:
+    def test_is_the_repository_root(self):
+        assert os.path.isfile(os.path.join(PROJECT_ROOTDIR, "schemas", "project.json"))
+        assert os.path.isdir(os.path.join(PROJECT_ROOTDIR, "awesome", "projects"))
+
+
+class TestSchemaCache:
+    def test_instances_share_compiled_schema(self):
+        assert (
+            ProjectValidator().schema_configuration
+            is ProjectValidator().schema_configuration
+        )
+
+    def test_subclass_with_other_schema_gets_its_own_validator(self):
+        class OtherValidator(ProjectValidator):
+            schema_name = "other"
+
+        with pytest.raises(FileNotFoundError):
+            OtherValidator()
+
+    def test_instances_do_not_share_results(self):
+        first = ProjectValidator()
+        first.validate(data=_project(), check_file_exists=False)
+        second = ProjectValidator()
+        assert second.metadata["total"] == 0
+        assert second.source_data == {}
+
+
+class TestCompileJsonschema:
+    def test_generated_validator_is_up_to_date(self):
+        # regenerate with `just build-validators` after editing schemas/project.json
+        assert get_jsonschema_sha256("project") == _project_validator.SCHEMA_SHA256
+
+    def test_generated_with_installed_fastjsonschema(self):
+        # regenerate with `just build-validators` after upgrading fastjsonschema
+        assert _project_validator.VERSION == fastjsonschema.VERSION
+
+    def test_uses_generated_validator(self):
+        assert compile_jsonschema("project") is _project_validator.validate
+
+    def test_stale_generated_validator_falls_back_to_compile(self, monkeypatch):
+        monkeypatch.setattr(_project_validator, "SCHEMA_SHA256", "stale")
+        validate = compile_jsonschema.__wrapped__("project")
+        assert validate is not _project_validator.validate
+        assert validate(_project())["name"] == "TestApp"
+
+    def test_generated_validator_from_other_version_falls_back(self, monkeypatch):
+        monkeypatch.setattr(_project_validator, "VERSION", "0.0.0")
+        assert (
+            compile_jsonschema.__wrapped__("project") is not _project_validator.validate
+        )
+
+
+# ---------------------------------------------------------------------------
+# save_state
+# ---------------------------------------------------------------------------
+
+
+class TestSaveState:
+    def test_routes_to_errors_and_warnings(self):
+        validator = ProjectValidator()
+        validator.save_state("a", "bad")
+        validator.save_state("b", "odd", "warnings")
+        assert validator.metadata["errors"] == [{"name": "a", "message": "bad"}]
+        assert validator.metadata["warnings"] == [{"name": "b", "message": "odd"}]
+        assert (validator.metadata["failed"], validator.metadata["warning"]) == (1, 1)
+
+    def test_rejects_unknown_key(self):
+        with pytest.raises(ValueError, match="Unsupported key 'other'"):
+            ProjectValidator().save_state("a", "bad", "other")
+
+
+# ---------------------------------------------------------------------------
+# validate
+# ---------------------------------------------------------------------------
+
+
+class TestValidateFile:
+    def test_valid_file(self, tmp_path):
+        _write(tmp_path, "alpha.json", _project())
+        validator = ProjectValidator()
+        data, errors = validator.validate(filename=str(tmp_path / "alpha.json"))
+        assert data["name"] == "TestApp"
+        assert errors is None
+
+    def test_schema_error_reports_exception_message(self):
+        validator = ProjectValidator()
+        data, errors = validator.validate(
+            data=_project(category="nope"), check_file_exists=False
+        )
+        assert data is None
+        assert [e["name"] for e in errors] == ["TestApp"]
+        assert errors[0]["message"].startswith("data.category must be one of")
+
+    def test_per_entity_line_only_when_verbose(self, monkeypatch, capsys):
+        validator = ProjectValidator()
+        monkeypatch.setattr("validator.VERBOSE", False)
+        validator.validate(data=_project(), check_file_exists=False)
+        assert "[VALIDATE]" not in capsys.readouterr().out
+
+        monkeypatch.setattr("validator.VERBOSE", True)
+        validator.validate(data=_project(), check_file_exists=False)
+        assert capsys.readouterr().out == "[VALIDATE] TestApp\n"
+
+    def test_missing_file_is_a_warning(self, tmp_path):
+        validator = ProjectValidator()
+        data, errors = validator.validate(filename=str(tmp_path / "missing.json"))
+        assert (data, errors) == ({}, None)
+        assert validator.metadata["warning"] == 1
+        assert validator.metadata["failed"] == 0
+
+    def test_malformed_json_is_an_error(self, tmp_path):
+        (tmp_path / "broken.json").write_bytes(b'{"name": ')
+        validator = ProjectValidator()
+        data, errors = validator.validate(filename=str(tmp_path / "broken.json"))
+        assert data is None
+        assert [e["name"] for e in errors] == ["broken.json"]
+        # the decoder's short message, without the position suffix of str(e)
+        assert "line 1" not in errors[0]["message"]
+        assert validator.metadata["failed"] == 1
+
+    def test_file_without_name_is_reported_by_file_name(self, tmp_path):
+        data = _project()
+        del data["name"]
+        _write(tmp_path, "anon.json", data)
+        _, errors = ProjectValidator().validate(filename=str(tmp_path / "anon.json"))
+        assert [e["name"] for e in errors] == ["anon.json"]
+
+    def test_directory_is_a_warning(self, tmp_path):
+        validator = ProjectValidator()
+        assert validator.validate(filename=str(tmp_path)) == ({}, None)
+        assert validator.metadata["warning"] == 1
+
+
+class TestDuplicateCheck:
+    def _with_filepath(self, filepath):
+        data = _project()
+        data["metadata"]["filepath"] = str(filepath)
+        return data
+
+    def test_warns_when_file_already_exists(self, tmp_path):
+        _write(tmp_path, "testapp-abc123.json", _project())
+        validator = ProjectValidator()
+        data, errors = validator.validate(
+            data=self._with_filepath(tmp_path / "testapp-abc123.json")
+        )
+        assert data is not None
+        assert errors is None
+        assert validator.metadata["warning"] == 1
+        assert validator.metadata["success"] == 0
+
+    def test_new_file_is_a_success(self, tmp_path):
+        _write(tmp_path, "other-abc123.json", _project())
+        validator = ProjectValidator()
+        candidates = [tmp_path / "testapp-abc123.json", tmp_path / "missing" / "x.json"]
+        for filepath in candidates:
+            validator.validate(data=self._with_filepath(filepath))
+        assert validator.metadata["warning"] == 0
+        assert validator.metadata["success"] == len(candidates)
+
+
+class TestIsAStartup:
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("Yes", True), ("No", False), (None, False)]
+    )
+    def test_issue_answer_is_converted_to_boolean(self, value, expected):
+        data = _project()
+        data["owner"]["is_a_startup"] = value
+        validated, errors = ProjectValidator().validate(
+            data=data, check_file_exists=False
+        )
+        assert errors is None
+        assert validated["owner"]["is_a_startup"] is expected
+
+    def test_missing_owner_is_an_error(self):
+        data = _project()
+        del data["owner"]
+        validator = ProjectValidator()
+        validated, errors = validator.validate(data=data, check_file_exists=False)
+        assert validated is None
+        assert errors == [{"name": "TestApp", "message": "'owner'"}]
+
+
+# ---------------------------------------------------------------------------
+# execute
+# ---------------------------------------------------------------------------
+
+
+class TestExecute:
+    def test_validates_json_files_in_sorted_order(self, tmp_path):
+        _write(tmp_path, "zeta.json", _project(name="Zeta"))
+        _write(tmp_path, "alpha.json", _project(name="Alpha"))
+        _write(tmp_path, "broken.json", _project(category="not-a-category"))
+
+        validator = ProjectValidator()
+        data = validator.execute(str(tmp_path))
+
+        assert list(data) == ["alpha", "zeta"]
+        assert data["alpha"]["name"] == "Alpha"
+        assert validator.metadata["success"] == len(data)
+        assert validator.metadata["failed"] == 1
+        assert validator.metadata["errors"][0]["name"] == "TestApp"
+
+    def test_malformed_file_does_not_stop_the_run(self, tmp_path):
+        _write(tmp_path, "alpha.json", _project(name="Alpha"))
+        (tmp_path / "broken.json").write_bytes(b'{"name": ')
+
+        validator = ProjectValidator()
+        data = validator.execute(str(tmp_path))
+
+        assert list(data) == ["alpha"]
+        assert validator.metadata["failed"] == 1
+        assert validator.metadata["errors"][0]["name"] == "broken.json"
+
+    def test_orders_by_entity_id_not_file_name(self, tmp_path):
+        _write(tmp_path, "a-b.json", _project(name="AB"))
+        _write(tmp_path, "a.json", _project(name="A"))
+        _write(tmp_path, "notes.json.json", _project(name="Notes"))
+
+        data = ProjectValidator().execute(str(tmp_path))
+
+        assert list(data) == ["a", "a-b", "notes.json"]
+
+    def test_skips_non_json_entries_with_warning(self, tmp_path):
+        _write(tmp_path, "alpha.json", _project())
+        (tmp_path / "notes.txt").write_text("not json", encoding="utf-8")
+        (tmp_path / "nested").mkdir()
+
+        validator = ProjectValidator()
+        data = validator.execute(str(tmp_path))
+
+        assert list(data) == ["alpha"]
+        warned = sorted(w["name"] for w in validator.metadata["warnings"])
+        assert warned == ["nested", "notes.txt"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        validator = ProjectValidator()
+        with pytest.raises(NotADirectoryError):
+            validator.execute(str(tmp_path / "missing"))
+
+
+# ---------------------------------------------------------------------------
+# print
+# ---------------------------------------------------------------------------
+
+
+class TestPrintSummary:
+    def test_lists_counters_errors_and_warnings(self, tmp_path, capsys):
+        _write(tmp_path, "alpha.json", _project())
+        _write(tmp_path, "broken.json", _project(name="Broken", category="nope"))
+        (tmp_path / "notes.txt").write_text("not json", encoding="utf-8")
+
+        validator = ProjectValidator()
+        validator.execute(str(tmp_path))
+        capsys.readouterr()
+        validator.print()
+        lines = capsys.readouterr().out.splitlines()
+
+        assert lines[:6] == [
+            "",
+            "[INFO] === Validation Summary for project ===",
+            "[INFO] Total scanned: 2",
+            "[INFO] Successful: 1",
+            "[INFO] Failed: 1",
+            "[INFO] Warnings: 1",
+        ]
+        assert "[ERROR] Validation Errors:" in lines
+        assert any(line.startswith("  ✗ Broken: ") for line in lines)
+        assert lines[-2:] == [
+            "[WARN] Warnings:",
+            "  ⚠ notes.txt: Invalid file extension (expected .json)",
+        ]